@@ -1,7 +1,10 @@
 class Abilities:
-    strength = None
-    intelligence = None
-    wisdom = None
-    dexterity = None
-    constitution = None
-    charisma = None
\ No newline at end of file
+    __slots__ = ('strength', 'intelligence', 'wisdom', 'dexterity', 'constitution', 'charisma')
+
+    def __init__(self):
+        self.strength = None
+        self.intelligence = None
+        self.wisdom = None
+        self.dexterity = None
+        self.constitution = None
+        self.charisma = None
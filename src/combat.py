@@ -1,20 +1,20 @@
 import random
-from dataclasses import make_dataclass
-import pandas as pd
 
 
 class Encounter():
-    combatants = list()
-    side_1 = dict()
-    side_2 = dict()
 
     def __init__(self, side_list):
+        # per-instance state, so separate encounters (and tests) never see each other's combatants
+        self.combatants = list()
+        self.side_1 = dict()
+        self.side_2 = dict()
+
         # make sure a list was passed in
         if not isinstance(side_list, list):
             raise ValueError('inputs must be a lists of members of each side')
 
-        if len(side_list) > 2:
-            raise ValueError('Only 2 sides are allowed')
+        if len(side_list) != 2:
+            raise ValueError('Exactly 2 sides are required')
 
         # make sure it is a list of lists
         inputs_valid = all([isinstance(s, list) for s in side_list])
@@ -23,19 +23,17 @@ class Encounter():
             raise ValueError('inputs must be a lists of members of each side')
 
         # for each side, add all the members to the combatants list with their side identifier
+        # and get the minumum suprise of all the entities on the side while we are there.
         side_number = 0
+        surprise_thresholds = []
         for side in side_list:
             side_number += 1
             for c in side:
                 self.combatants.append({'combatant': c, 'side': side_number})
+            surprise_thresholds.append(min([c.get_surprise_threshold() for c in side]))
 
         # determine surprise by side and distance by side
-
-        # get the minumum suprise of all the entities on the side.
-        first_surprise_threshold = min([e['combatant'].get_surprise_threshold() for e in self.combatants if
-                                        e['side'] == 1])
-        second_surpise_threshold = min([e['combatant'].get_surprise_threshold() for e in self.combatants if
-                                        e['side'] == 2])
+        first_surprise_threshold, second_surpise_threshold = surprise_thresholds
 
         roll_side1 = random.randint(1, 6)
         roll_side2 = random.randint(1, 6)  # TODO: some monsters have 1 in 8, might need to convert to %
@@ -72,12 +70,13 @@ class Encounter():
         pass
 
     def attack(self, attacker_class='Monster', attacker_level=1, defendor_armor_type=10, defender_armor_class=10):
-        cleric_table = make_dataclass("cleric", [("ac", int), "level", int])
-
         return True
 
 
 if __name__ == '__main__':
+    # pandas is only needed to build the table below; keep it off the import path of Encounter
+    import pandas as pd
+
     def combat_range(start, end, first):
         twenty_run = 6
         value_list = []
@@ -3,9 +3,14 @@ import random
 
 class Dice:
 
-    def __int__(self):
-        pass
+    def __init__(self, seed=None):
+        # only seeded dice get their own generator; otherwise roll from the shared random module.
+        # random.randint is bound here, so patching it only affects Dice created while the patch is active.
+        if seed is None:
+            self._randint = random.randint
+        else:
+            self._randint = random.Random(seed).randint
 
     def roll(self, count=1, sides=6):
-        results = [random.randint(1, sides) for i in range(0, count)]
-        return sum(results)
\ No newline at end of file
+        randint = self._randint
+        return sum([randint(1, sides) for i in range(count)])
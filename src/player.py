@@ -3,7 +3,6 @@ import json
 
 
 class Person:
-    abilities = Abilities()
     level = 0
     hit_points = 0
     ac = 10
@@ -11,6 +10,10 @@ class Person:
     name = 'generic person'
     race = 'human'
 
+    def __init__(self):
+        # each person gets their own scores rather than sharing one class-level Abilities
+        self.abilities = Abilities()
+
     def load(self, path_to_file):
         with open(path_to_file) as f:
             person_dict = json.load(f)
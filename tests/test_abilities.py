@@ -0,0 +1,26 @@
+import unittest
+from src.abilities import Abilities
+
+
+class TestAbilities(unittest.TestCase):
+    scores = ('strength', 'intelligence', 'wisdom', 'dexterity', 'constitution', 'charisma')
+
+    def test_scores_start_unset(self):
+        a = Abilities()
+        for score in self.scores:
+            self.assertIsNone(getattr(a, score))
+
+    def test_scores_can_be_assigned(self):
+        a = Abilities()
+        for value, score in enumerate(self.scores, start=3):
+            setattr(a, score, value)
+        self.assertEqual([getattr(a, score) for score in self.scores], [3, 4, 5, 6, 7, 8])
+
+    def test_only_the_six_scores_are_allowed(self):
+        a = Abilities()
+        with self.assertRaises(AttributeError):
+            a.luck = 10
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,68 @@
+import os
+import sys
 import unittest
+from unittest.mock import patch
+from src.combat import Encounter
+from src.monster import Monster
+
+# player.py uses the same script-style imports as main.py, so it is imported from src directly
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from player import Person
+
+
+class Scout:
+    def __init__(self, surprise_threshold):
+        self.surprise_threshold = surprise_threshold
+
+    def get_surprise_threshold(self):
+        return self.surprise_threshold
 
 
 class TestCombat(unittest.TestCase):
 
     def test_surprise(self):
+        # side 1 rolls 1 against a threshold of 2 and is surprised, side 2 rolls 4 against 3 and is not
+        with patch('random.randint', side_effect=[1, 4]):
+            fight = Encounter([[Monster()], [Scout(3)]])
+
+        self.assertEqual(fight.side_2['extra_segments'], 3)
+        self.assertNotIn('extra_segments', fight.side_1)
+
+    def test_surprise_uses_lowest_threshold_on_each_side(self):
+        # side 1's lowest threshold is 1, so a roll of 5 does not surprise it;
+        # side 2's lowest is 5, so a roll of 2 does
+        with patch('random.randint', side_effect=[5, 2]):
+            fight = Encounter([[Monster(), Scout(1)], [Scout(6), Scout(5)]])
+
+        self.assertEqual(fight.side_1['extra_segments'], 3)
+        self.assertNotIn('extra_segments', fight.side_2)
+
+    def test_requires_two_sides(self):
+        with self.assertRaises(ValueError):
+            Encounter([[Monster()]])
+        with self.assertRaises(ValueError):
+            Encounter([[Monster()], [Monster()], [Monster()]])
+
+    def test_attack_returns_true(self):
+        fight = Encounter([[Monster()], [Monster()]])
+
+        self.assertTrue(fight.attack())
+
+    def test_encounters_do_not_share_combatants(self):
+        first = Encounter([[Monster()], [Monster()]])
+        second = Encounter([[Monster()], [Monster(), Monster()]])
+
+        self.assertEqual(len(first.combatants), 2)
+        self.assertEqual(len(second.combatants), 3)
+        self.assertIsNot(first.side_1, second.side_1)
 
+    def test_people_do_not_share_abilities(self):
+        first = Person()
+        second = Person()
+        first.abilities.strength = 18
 
-        self.assertEqual(1, 1)
+        self.assertIsNot(first.abilities, second.abilities)
+        self.assertIsNone(second.abilities.strength)
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import MagicMock
 from src.dice import Dice
@@ -10,6 +11,20 @@ class TestDice(unittest.TestCase):
         print(value)
         self.assertLessEqual(value, 6)
 
+    def test_seeded_dice_repeat(self):
+        first = Dice(seed=42)
+        second = Dice(seed=42)
+        self.assertEqual([first.roll(3, 6) for i in range(5)], [second.roll(3, 6) for i in range(5)])
+
+    def test_unseeded_dice_follow_random_seed(self):
+        # don't leave the shared generator seeded for the tests that run after this one
+        self.addCleanup(random.setstate, random.getstate())
+        random.seed(7)
+        first = Dice().roll(3, 6)
+        random.seed(7)
+        second = Dice().roll(3, 6)
+        self.assertEqual(first, second)
+
     def test_mock_dice(self):
         d = Dice()
         d.roll = MagicMock(return_value=1)